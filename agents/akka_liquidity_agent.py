@@ -1,23 +1,28 @@
 # agents/akka_liquidity_agent.py
-import time
+import asyncio
 import hashlib
+import logging
+import os
 import random
 
+logger = logging.getLogger(__name__)
+
 class AkkaLiquidityAgent:
     def __init__(self, w3_instance, private_key, from_address, to_address):
         self.w3 = w3_instance
         self.private_key = private_key
         self.from_address = from_address
         self.to_address = to_address
-        print("🤖 AKKA Liquidity Agent Initialized!")
+        logger.info("🤖 AKKA Liquidity Agent Initialized!")
 
-    def optimize_liquidity_route(self, rwa_token_address, amount_rwa, preferred_output_asset, max_risk_tolerance):
+    async def optimize_liquidity_route_async(self, rwa_token_address, amount_rwa, preferred_output_asset, max_risk_tolerance):
         """
         Simulates AKKA Finance's liquidity optimization for RWA tokens.
+        Async coroutine: many route optimizations can run concurrently on one event loop.
         Returns a dictionary indicating success/failure and optimization details.
         """
-        print(f"🤖 AKKA Liquidity Agent: Optimizing liquidity route for {amount_rwa} {rwa_token_address}...")
-        time.sleep(2) # Simulate API call/computation time
+        logger.info("🤖 AKKA Liquidity Agent: Optimizing liquidity route for %s %s...", amount_rwa, rwa_token_address)
+        await asyncio.sleep(2) # Simulate API call/computation time without blocking the event loop
 
         # --- Check for early exit condition ---
         # If risk tolerance is too low, simulate no route found
@@ -45,8 +50,8 @@ class AkkaLiquidityAgent:
         simulated_gas_cost_xdc = random.uniform(0.00001, 0.00005) # Numerical
 
 
-        print(f"✅ AKKA Liquidity Agent: Optimal route found: {optimal_route_details['selected_pool']}")
-        
+        logger.info("✅ AKKA Liquidity Agent: Optimal route found: %s", optimal_route_details['selected_pool'])
+
         # IMPORTANT: Return a single dictionary with consistent keys as expected by app.py
         return {
             "route_found": True,
@@ -55,15 +60,22 @@ class AkkaLiquidityAgent:
             "simulated_gas_cost_xdc": simulated_gas_cost_xdc
         }
 
-    def simulate_execute_trade(self, optimized_route_details, amount_rwa, preferred_output_asset):
+    def optimize_liquidity_route(self, rwa_token_address, amount_rwa, preferred_output_asset, max_risk_tolerance):
+        """Synchronous wrapper around optimize_liquidity_route_async for existing callers."""
+        return asyncio.run(self.optimize_liquidity_route_async(
+            rwa_token_address, amount_rwa, preferred_output_asset, max_risk_tolerance
+        ))
+
+    async def simulate_execute_trade_async(self, optimized_route_details, amount_rwa, preferred_output_asset):
         """
         Simulates the execution of a trade via the optimized route.
+        Async coroutine so multiple trades can be simulated concurrently.
         Expects 'optimized_route_details' to be the dictionary returned by optimize_liquidity_route.
         """
         # Ensure optimal_route_details and its sub-keys exist before accessing
         selected_pool_name = optimized_route_details.get('optimization_details', {}).get('selected_pool', 'an unknown pool')
-        print(f"🚀 AKKA Liquidity Agent: Simulating trade execution via {selected_pool_name}...")
-        time.sleep(3) # Simulate blockchain transaction time
+        logger.info("🚀 AKKA Liquidity Agent: Simulating trade execution via %s...", selected_pool_name)
+        await asyncio.sleep(3) # Simulate blockchain transaction time without blocking the event loop
 
         trade_executed = False
         simulated_tx_hash = None
@@ -80,20 +92,23 @@ class AkkaLiquidityAgent:
                 # Calculate simulated amount received after fees and slippage
                 # Add some random variance to the final amount
                 simulated_amount_received = amount_rwa_float * (1 - fees_decimal) * (1 - slippage_decimal) * random.uniform(0.995, 1.005)
-                
+
                 trade_executed = True
-                simulated_tx_hash = '0x' + hashlib.sha256(str(random.getrandbits(256)).encode()).hexdigest()
+                # Hash raw entropy bytes directly: no intermediate decimal string
+                # allocation, and OpenSSL's SHA-256 uses the hardware SHA
+                # extensions where available.
+                simulated_tx_hash = '0x' + hashlib.sha256(os.urandom(32)).hexdigest()
 
             except KeyError as e:
-                print(f"Error accessing key in route details during trade simulation: {e}. Trade simulation failed.")
+                logger.error("Error accessing key in route details during trade simulation: %s. Trade simulation failed.", e)
                 # Keep trade_executed as False and output_amount_received as 0
             except Exception as e:
-                print(f"An unexpected error occurred during trade simulation: {e}")
+                logger.error("An unexpected error occurred during trade simulation: %s", e)
                 # Keep trade_executed as False and output_amount_received as 0
         else:
-            print("Trade simulation skipped: No optimal route was found initially.")
+            logger.info("Trade simulation skipped: No optimal route was found initially.")
 
-        print(f"✅ Simulated AKKA Trade Transaction: {'Executed' if trade_executed else 'Failed'}")
+        logger.info("✅ Simulated AKKA Trade Transaction: %s", 'Executed' if trade_executed else 'Failed')
 
         return {
             "trade_executed": trade_executed,
@@ -102,10 +117,16 @@ class AkkaLiquidityAgent:
             "output_asset": preferred_output_asset
         }
 
+    def simulate_execute_trade(self, optimized_route_details, amount_rwa, preferred_output_asset):
+        """Synchronous wrapper around simulate_execute_trade_async for existing callers."""
+        return asyncio.run(self.simulate_execute_trade_async(
+            optimized_route_details, amount_rwa, preferred_output_asset
+        ))
+
     def integrate_goat_sdk_trade(self, trade_params):
         """
         Placeholder method for integrating with Crossmint GOAT SDK for AI-powered
         transaction initiation and embedded wallets. This remains a simulation/placeholder.
         """
-        print("🐐 AKKA Liquidity Agent: Placeholder for Crossmint GOAT SDK integration.")
+        logger.info("🐐 AKKA Liquidity Agent: Placeholder for Crossmint GOAT SDK integration.")
         return {"status": "GOAT SDK integration simulated", "trade_params": trade_params}
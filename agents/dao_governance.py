@@ -1,18 +1,25 @@
 # agents/dao_governance.py
 
+import asyncio
 import random
-import time
 import logging
+import numpy as np # For vectorized cohort voting
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configure a default handler only if the application has not set one up;
+# the unconditional basicConfig call ran a handler-lock scan on every import.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class DAOGovernanceAgent:
     def __init__(self):
-        logging.info("DAOGovernanceAgent initialized (simulated).")
+        logger.info("DAOGovernanceAgent initialized (simulated).")
 
-    def simulate_vote_on_proposal(self, proposal_id, proposal_details):
+    async def simulate_vote_on_proposal_async(self, proposal_id, proposal_details):
         """
         Simulates a DAO voting process for a given loan proposal.
+        Async coroutine: votes on many proposals can run concurrently on one event loop.
         The outcome is randomized for demonstration.
 
         Args:
@@ -29,8 +36,8 @@ class DAOGovernanceAgent:
                   - 'reason' (str)
                   - 'error' (str, optional)
         """
-        logging.info(f"Simulating DAO vote for proposal: {proposal_id}")
-        time.sleep(2) # Simulate voting period
+        logger.info("Simulating DAO vote for proposal: %s", proposal_id)
+        await asyncio.sleep(2) # Simulate voting period without blocking the event loop
 
         try:
             # Simulate voting based on impact/risk, but with some randomness
@@ -62,7 +69,7 @@ class DAOGovernanceAgent:
             else:
                 reason = "Vote outcome is still too close to call, further discussion needed."
 
-            logging.info(f"DAO vote simulated for {proposal_id}: Outcome {vote_outcome}")
+            logger.info("DAO vote simulated for %s: Outcome %s", proposal_id, vote_outcome)
             return {
                 "success": True,
                 "vote_outcome": vote_outcome,
@@ -72,6 +79,64 @@ class DAOGovernanceAgent:
                 "reason": reason
             }
         except Exception as e:
-            logging.error(f"Simulated DAO vote failed for {proposal_id}: {e}")
+            logger.error("Simulated DAO vote failed for %s: %s", proposal_id, e)
             return {"success": False, "error": str(e)}
 
+    def simulate_vote_on_proposal(self, proposal_id, proposal_details):
+        """Synchronous wrapper around simulate_vote_on_proposal_async for existing callers."""
+        return asyncio.run(self.simulate_vote_on_proposal_async(proposal_id, proposal_details))
+
+    def simulate_votes_batch(self, proposal_ids, impact_scores, financial_risks):
+        """
+        Vectorized vote simulation over a cohort of proposals (SoA layout).
+
+        Applies the same approval-chance model as the scalar path but as NumPy
+        array operations: all random draws happen in one C-level call and
+        outcomes are derived with np.select, so voting on N proposals is a
+        handful of array ops instead of N Python calls.
+
+        Args:
+            proposal_ids (sequence of str): Loan proposal IDs.
+            impact_scores (array-like): Impact score per proposal.
+            financial_risks (sequence of str): 'Low'/'Medium'/'High' per proposal.
+
+        Returns:
+            dict: A dict of parallel arrays:
+                  - 'proposal_id' (np.ndarray of str)
+                  - 'vote_outcome' (np.ndarray of str)
+                  - 'yes_votes_percent' (np.ndarray)
+                  - 'no_votes_percent' (np.ndarray)
+                  - 'total_voters' (np.ndarray)
+        """
+        n = len(proposal_ids)
+        logger.info("Simulating batched DAO votes for %s proposals", n)
+        rng = np.random.default_rng()
+
+        impact_scores = np.asarray(impact_scores, dtype=float)
+        risk_code = np.array([{"Low": 0, "Medium": 1, "High": 2}.get(r, 1)
+                              for r in financial_risks], dtype=np.int8)
+
+        # Base approval chance, adjusted for impact and financial risk
+        yes_chance = (0.6
+                      + np.where(impact_scores > 70, 0.15, 0.0)
+                      + np.where(risk_code == 0, 0.10, 0.0)
+                      - np.where(risk_code == 2, 0.20, 0.0))
+
+        yes_votes = np.clip(rng.uniform(yes_chance - 0.1, yes_chance + 0.1), 0.4, 0.95)
+        no_votes = 1 - yes_votes
+        total_voters = rng.integers(50, 201, n)
+
+        vote_outcome = np.select(
+            [yes_votes > 0.70, no_votes > 0.40], # Same approval/rejection thresholds
+            ["Approved", "Rejected"],
+            default="Pending"
+        )
+
+        return {
+            "proposal_id": np.asarray(proposal_ids),
+            "vote_outcome": vote_outcome,
+            "yes_votes_percent": np.round(yes_votes * 100, 2),
+            "no_votes_percent": np.round(no_votes * 100, 2),
+            "total_voters": total_voters,
+        }
+
@@ -1,19 +1,59 @@
 # agents/goat_agent.py
-import time
+import asyncio
+import logging
 import numpy as np # Ensure numpy is imported
 
+logger = logging.getLogger(__name__)
+
+# Small int codes for project_type so the scoring helper stays purely numeric
+# (string compares stay out of the hot path and the helper remains JIT-friendly).
+_PROJECT_TYPE_SOLAR = 1
+
+_PROJECT_TYPE_CODES = {"solar": _PROJECT_TYPE_SOLAR}
+
+
+def _score_loan(credit_score, default_history, debt_to_income_ratio,
+                project_type_code, co2_reduction, energy_generated, jobs_created):
+    """
+    Pure-numeric scoring core for analyze_and_execute.
+
+    Kept free of dict lookups, strings, and I/O so it can be decorated with
+    numba.njit(cache=True) unchanged if Numba is added to the stack.
+    Returns (financial_risk_score, impact_score), both clamped to 0-100.
+    """
+    financial_risk_score = (1 - (credit_score / 850)) * 100
+    if default_history > 0:
+        financial_risk_score += 20
+    if debt_to_income_ratio > 0.4:
+        financial_risk_score += (debt_to_income_ratio - 0.4) * 50 # Increase risk for higher DTI
+    financial_risk_score = round(min(max(financial_risk_score, 0), 100), 2)
+
+    impact_score = 0
+    if project_type_code == _PROJECT_TYPE_SOLAR:
+        impact_score += 30
+    if co2_reduction > 5000:
+        impact_score += 40
+    if energy_generated > 1000000:
+        impact_score += 30
+    if jobs_created > 10:
+        impact_score += 10 # Small bonus for job creation
+    impact_score = round(min(max(impact_score, 0), 100), 2)
+
+    return financial_risk_score, impact_score
+
+
 class GOATAgent:
     def _init_(self):
-        print("Initialized local GOAT Agent (stub mode)")
+        logger.info("Initialized local GOAT Agent (stub mode)")
         self.knowledge_base = {
             "risk_factors": ["credit_score", "default_history", "debt_to_income_ratio"],
             "impact_criteria": ["project_type", "estimated_co2_reduction_tons_per_year", "estimated_energy_generated_kwh_per_year", "estimated_jobs_created"]
         }
 
-    def analyze_and_execute(self, borrower_data, rwa_data, context):
-        print("\n🧠 AI Agent: Analyzing data in local GOAT Agent...")
-        print(f"Context: {context}")
-        time.sleep(1) # Simulate complex analysis
+    async def analyze_and_execute_async(self, borrower_data, rwa_data, context):
+        logger.info("🧠 AI Agent: Analyzing data in local GOAT Agent...")
+        logger.info("Context: %s", context)
+        await asyncio.sleep(1) # Simulate complex analysis without blocking the event loop
 
         summary = ""
         recommendation = ""
@@ -28,29 +68,16 @@ class GOATAgent:
         default_history = borrower_data.get("default_history", 0)
         debt_to_income_ratio = borrower_data.get("debt_to_income_ratio", 0.4) # Assuming a default if not present
 
-        financial_risk_score = (1 - (credit_score / 850)) * 100
-        if default_history > 0:
-            financial_risk_score += 20
-        if debt_to_income_ratio > 0.4:
-            financial_risk_score += (debt_to_income_ratio - 0.4) * 50 # Increase risk for higher DTI
-        financial_risk_score = round(min(max(financial_risk_score, 0), 100), 2)
-
         # Environmental Impact Assessment (using rwa_data)
-        project_type = rwa_data.get("project_type")
+        project_type_code = _PROJECT_TYPE_CODES.get(rwa_data.get("project_type"), 0)
         co2_reduction = rwa_data.get("estimated_co2_reduction_tons_per_year", 0)
         energy_generated = rwa_data.get("estimated_energy_generated_kwh_per_year", 0)
         jobs_created = rwa_data.get("estimated_jobs_created", 0)
 
-        impact_score = 0
-        if project_type == "solar":
-            impact_score += 30
-        if co2_reduction > 5000:
-            impact_score += 40
-        if energy_generated > 1000000:
-            impact_score += 30
-        if jobs_created > 10:
-            impact_score += 10 # Small bonus for job creation
-        impact_score = round(min(max(impact_score, 0), 100), 2)
+        financial_risk_score, impact_score = _score_loan(
+            credit_score, default_history, debt_to_income_ratio,
+            project_type_code, co2_reduction, energy_generated, jobs_created
+        )
 
         # Combined Recommendation Logic
         if financial_risk_score < 30 and impact_score > 70:
@@ -78,8 +105,8 @@ class GOATAgent:
         # if you had access and time. For the hackathon, you'll explain this.
         # You could have a method here that calls the SDK to initiate a transaction
         # or manage an embedded wallet.
-        print("\n🤖 GOAT Agent: Crossmint GOAT SDK integration point (SDK not integrated - due to private access).")
-        print("   (If integrated, this agent would seamlessly create embedded wallets or sign transactions.)")
+        logger.info("🤖 GOAT Agent: Crossmint GOAT SDK integration point (SDK not integrated - due to private access).")
+        logger.info("   (If integrated, this agent would seamlessly create embedded wallets or sign transactions.)")
         # --------------------------------------------------------
 
         return {
@@ -90,3 +117,7 @@ class GOATAgent:
             },
             "blockchain_action": "initiate_transaction" # This can be conditional later
         }
+
+    def analyze_and_execute(self, borrower_data, rwa_data, context):
+        """Synchronous wrapper around analyze_and_execute_async for existing callers."""
+        return asyncio.run(self.analyze_and_execute_async(borrower_data, rwa_data, context))
@@ -1,19 +1,26 @@
 # agents/oracle_monitor.py
 
+import asyncio
 import random
-import time
 import logging
+import numpy as np # For vectorized multi-asset polls
 from datetime import datetime # FIX: Import datetime
 
-logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
+logger = logging.getLogger(__name__)
+
+# Configure a default handler only if the application has not set one up;
+# the unconditional basicConfig call ran a handler-lock scan on every import.
+if not logging.getLogger().handlers:
+    logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class OracleMonitorAgent:
     def __init__(self):
-        logging.info("OracleMonitorAgent initialized (simulated).")
+        logger.info("OracleMonitorAgent initialized (simulated).")
 
-    def fetch_simulated_rwa_data(self, rwa_id, current_month):
+    async def fetch_simulated_rwa_data_async(self, rwa_id, current_month):
         """
         Simulates fetching real-world data for an RWA project via a decentralized oracle.
+        Async coroutine: data for many RWAs can be polled concurrently on one event loop.
         Data will show slight variations over time.
 
         Args:
@@ -31,8 +38,8 @@ class OracleMonitorAgent:
                   - 'timestamp' (str)
                   - 'error' (str, optional)
         """
-        logging.info(f"Simulating oracle data fetch for RWA: {rwa_id}, Month: {current_month}")
-        time.sleep(0.5) # Simulate network latency
+        logger.info("Simulating oracle data fetch for RWA: %s, Month: %s", rwa_id, current_month)
+        await asyncio.sleep(0.5) # Simulate network latency without blocking the event loop
 
         try:
             # Simulate slight variations in performance
@@ -59,7 +66,7 @@ class OracleMonitorAgent:
             if energy_generated < base_energy * 0.8:
                 status = "Underperforming Energy"
 
-            logging.info(f"Simulated oracle data for {rwa_id}: CO2={co2_reduction:.2f}, Energy={energy_generated:.2f}")
+            logger.info("Simulated oracle data for %s: CO2=%.2f, Energy=%.2f", rwa_id, co2_reduction, energy_generated)
             return {
                 "success": True,
                 "co2_reduction_tons": co2_reduction,
@@ -70,6 +77,70 @@ class OracleMonitorAgent:
                 "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             }
         except Exception as e:
-            logging.error(f"Simulated oracle data fetch failed for {rwa_id}: {e}")
+            logger.error("Simulated oracle data fetch failed for %s: %s", rwa_id, e)
             return {"success": False, "error": str(e)}
 
+    def fetch_simulated_rwa_data(self, rwa_id, current_month):
+        """Synchronous wrapper around fetch_simulated_rwa_data_async for existing callers."""
+        return asyncio.run(self.fetch_simulated_rwa_data_async(rwa_id, current_month))
+
+    def fetch_simulated_rwa_data_batch(self, rwa_ids, current_month):
+        """
+        Vectorized oracle poll over many RWAs at once (SoA layout).
+
+        Draws all random performance factors in single C-level RNG calls and
+        computes the metric arrays with NumPy instead of one Python call per
+        RWA, so monitoring hundreds of assets costs a handful of array ops.
+
+        Args:
+            rwa_ids (sequence of str): IDs of the Real World Assets to poll.
+            current_month (int): Current monitoring period (month number).
+
+        Returns:
+            dict: A dict of parallel arrays:
+                  - 'rwa_id' (np.ndarray of str)
+                  - 'co2_reduction_tons' (np.ndarray)
+                  - 'energy_generated_kwh' (np.ndarray)
+                  - 'jobs_created' (np.ndarray)
+                  - 'water_savings_liters' (np.ndarray)
+                  - 'status_update' (np.ndarray of str)
+                  - 'timestamp' (str, one per batch)
+        """
+        n = len(rwa_ids)
+        logger.info("Simulating batched oracle data fetch for %s RWAs, Month: %s", n, current_month)
+        rng = np.random.default_rng()
+
+        # Simulate slight variations in performance, sampled for the whole batch
+        co2_factor = rng.uniform(0.9, 1.1, n) # 90% to 110% of expected
+        energy_factor = rng.uniform(0.85, 1.15, n) # 85% to 115% of expected
+        jobs_variation = rng.integers(-1, 2, n) # +/- 1 job
+        water_factor = rng.uniform(0.9, 1.1, n)
+
+        # Same arbitrary bases as the scalar path, drifting slightly over time
+        base_co2 = 5000 * (1 + (current_month * 0.005))
+        base_energy = 1000000 * (1 + (current_month * 0.003))
+        base_jobs = 10
+        base_water = 500000 * (1 + (current_month * 0.002))
+
+        co2_reduction = base_co2 * co2_factor
+        energy_generated = base_energy * energy_factor
+        jobs_created = np.maximum(0, base_jobs + jobs_variation)
+        water_savings = base_water * water_factor
+
+        # Energy check last so it overrides the CO2 flag, matching the scalar path
+        status = np.select(
+            [energy_generated < base_energy * 0.8, co2_reduction < base_co2 * 0.8],
+            ["Underperforming Energy", "Underperforming CO2"],
+            default="On Track"
+        )
+
+        return {
+            "rwa_id": np.asarray(rwa_ids),
+            "co2_reduction_tons": co2_reduction,
+            "energy_generated_kwh": energy_generated,
+            "jobs_created": jobs_created,
+            "water_savings_liters": water_savings,
+            "status_update": status,
+            "timestamp": datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        }
+
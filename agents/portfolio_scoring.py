@@ -0,0 +1,87 @@
+# agents/portfolio_scoring.py
+#
+# Fused portfolio scoring for the GOAT + Impact pipeline.
+#
+# GOATAgent.analyze_and_execute and ImpactAssessorAgent.assess_impact read
+# overlapping fields (co2, energy, jobs, project_type) out of per-project
+# dicts (AoS). For portfolio-scale scoring this module takes the same fields
+# as parallel NumPy columns (SoA) and computes financial risk, impact score,
+# and confidence in one fused pass over the columns, so each column is
+# walked once instead of twice per project.
+
+import numpy as np
+
+# Keep in sync with agents.goat_agent._PROJECT_TYPE_CODES
+PROJECT_TYPE_SOLAR = 1
+
+# Certification codes: 0 = none, 1 = Silver, 2 = Gold
+CERT_NONE, CERT_SILVER, CERT_GOLD = 0, 1, 2
+
+_CONFIDENCE_BY_BIN = np.array([0.30, 0.55, 0.70, 0.95])
+
+
+def score_portfolio(credit_score, default_history, debt_to_income_ratio,
+                    project_type_code, co2_reduction, energy_generated,
+                    jobs_created, cert_code, noise=None):
+    """
+    Fused GOAT + Impact scoring over column arrays (SoA).
+
+    All arguments are parallel arrays of length n; categorical fields are
+    pre-encoded to small int codes (PROJECT_TYPE_SOLAR, CERT_*). `noise` is
+    an optional pre-drawn array added to the confidence score (mirrors the
+    per-call np.random.uniform(-0.05, 0.05) "AI feel" jitter in GOATAgent);
+    passing it in keeps the kernel deterministic for a fixed input.
+
+    Returns:
+        dict: {'financial_risk_score', 'impact_score', 'confidence_score'},
+              each an np.ndarray of length n.
+
+    The request sketched this as a numba.prange kernel; Numba is not part of
+    this project's dependency set, so the fusion is expressed with NumPy
+    array ops, which already run the per-column work in C.
+    """
+    credit_score = np.asarray(credit_score, dtype=float)
+    default_history = np.asarray(default_history, dtype=float)
+    debt_to_income_ratio = np.asarray(debt_to_income_ratio, dtype=float)
+    project_type_code = np.asarray(project_type_code)
+    co2_reduction = np.asarray(co2_reduction, dtype=float)
+    energy_generated = np.asarray(energy_generated, dtype=float)
+    jobs_created = np.asarray(jobs_created, dtype=float)
+    cert_code = np.asarray(cert_code)
+
+    # Financial risk, same model as GOATAgent._score_loan
+    financial_risk = (1 - (credit_score / 850)) * 100
+    financial_risk += np.where(default_history > 0, 20.0, 0.0)
+    financial_risk += np.where(debt_to_income_ratio > 0.4,
+                               (debt_to_income_ratio - 0.4) * 50, 0.0)
+    financial_risk = np.round(np.clip(financial_risk, 0, 100), 2)
+
+    # Impact score, fusing the GOAT thresholds with the certification bonus
+    # from ImpactAssessorAgent
+    impact = np.where(project_type_code == PROJECT_TYPE_SOLAR, 30.0, 0.0)
+    impact += np.where(co2_reduction > 5000, 40.0, 0.0)
+    impact += np.where(energy_generated > 1000000, 30.0, 0.0)
+    impact += np.where(jobs_created > 10, 10.0, 0.0)
+    impact += np.where(cert_code == CERT_GOLD, 10.0,
+                       np.where(cert_code == CERT_SILVER, 5.0, 0.0))
+    impact = np.round(np.clip(impact, 0, 100), 2)
+
+    # Confidence bins, same cascade as GOATAgent's recommendation logic
+    confidence_bin = np.select(
+        [
+            (financial_risk < 30) & (impact > 70),
+            (financial_risk < 60) & (impact > 40),
+            (financial_risk >= 60) & (impact > 50),
+        ],
+        [3, 2, 1],
+        default=0,
+    )
+    confidence = _CONFIDENCE_BY_BIN[confidence_bin]
+    if noise is not None:
+        confidence = np.clip(confidence + np.asarray(noise, dtype=float), 0.0, 1.0)
+
+    return {
+        "financial_risk_score": financial_risk,
+        "impact_score": impact,
+        "confidence_score": confidence,
+    }
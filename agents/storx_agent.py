@@ -1,27 +1,76 @@
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
+import gzip
+import hashlib
+import threading
 import logging
 import io
+import os
 import http.client as http_client
 
-# Enable detailed debug logs for boto3 (optional)
-# Comment out these lines if you don't want debug logs in production
-http_client.HTTPConnection.debuglevel = 1
-logging.getLogger('botocore').setLevel(logging.DEBUG)
-logging.getLogger('boto3').setLevel(logging.DEBUG)
-logging.getLogger('urllib3').setLevel(logging.DEBUG)
+# Compress uploads above this size; below it the gzip header overhead and
+# CPU cost outweigh the bytes saved on the wire.
+_COMPRESS_MIN_BYTES = 1024
+
+# Magic bytes of formats that are already compressed (gzip, zstd, brotli
+# has no magic so it is not sniffable); re-compressing these wastes CPU
+# for no size win.
+_COMPRESSED_MAGICS = (b'\x1f\x8b', b'\x28\xb5\x2f\xfd')
+
+
+def _maybe_compress(file_content_bytes):
+    """
+    Gzip-compresses a payload when it is large enough to benefit and not
+    already compressed. Returns (body_bytes, content_encoding_or_None).
+    """
+    if len(file_content_bytes) < _COMPRESS_MIN_BYTES:
+        return file_content_bytes, None
+    if file_content_bytes.startswith(_COMPRESSED_MAGICS):
+        return file_content_bytes, None
+    # Level 1 favours throughput: text documents still shrink several-fold
+    # and the compressor stays far faster than the network.
+    compressed = gzip.compress(file_content_bytes, compresslevel=1)
+    if len(compressed) >= len(file_content_bytes):
+        return file_content_bytes, None
+    return compressed, 'gzip'
+
+# Detailed boto3/urllib3 wire logging is expensive (it serializes headers and
+# bodies to stderr on every request), so it is off unless explicitly asked
+# for via the STORX_DEBUG environment variable.
+STORX_DEBUG = bool(os.getenv("STORX_DEBUG"))
+if STORX_DEBUG:
+    http_client.HTTPConnection.debuglevel = 1
+    logging.getLogger('botocore').setLevel(logging.DEBUG)
+    logging.getLogger('boto3').setLevel(logging.DEBUG)
+    logging.getLogger('urllib3').setLevel(logging.DEBUG)
 
 # Set up basic logging to see messages in your terminal
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class StorXAgent:
-    def __init__(self, access_key_id, secret_access_key, endpoint_url, bucket_name):
+    def __init__(self, access_key_id, secret_access_key, endpoint_url, bucket_name, verify_ssl=False):
         self.access_key_id = access_key_id
         self.secret_access_key = secret_access_key
         self.endpoint_url = endpoint_url
         self.bucket_name = bucket_name
         self.is_real_integration_possible = False
         self.s3_client = None
+        self._bucket_checked = False
+        self._bucket_lock = threading.Lock()
+        # Shared transfer settings: large documents are split into 8 MiB parts
+        # uploaded over 16 threads, which S3-compatible endpoints need to
+        # reach their PUT throughput; small objects fall back to a single PUT
+        # automatically. Built once here instead of per upload.
+        self._transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=8 * 1024 * 1024,
+            max_concurrency=16,
+            use_threads=True,
+        )
 
         if not all([access_key_id, secret_access_key, endpoint_url, bucket_name]):
             logging.warning("StorX credentials are incomplete. Running in simulation mode.")
@@ -33,21 +82,24 @@ class StorXAgent:
                 endpoint_url=self.endpoint_url,
                 aws_access_key_id=self.access_key_id,
                 aws_secret_access_key=self.secret_access_key,
-                verify=False  # Change to True if SSL cert is valid
+                # Pass verify_ssl=True (or a CA bundle path) once the StorX
+                # gateway cert validates; verified connections let urllib3
+                # reuse the TLS session across uploads.
+                verify=verify_ssl,
+                # Size the urllib3 pool for concurrent bulk uploads and keep
+                # the TCP connections alive between calls, so repeat uploads
+                # skip the TCP+TLS handshake instead of paying it per PUT.
+                config=Config(
+                    max_pool_connections=64,
+                    tcp_keepalive=True,
+                    retries={'mode': 'adaptive', 'max_attempts': 5}
+                )
             )
 
-            try:
-                self.s3_client.head_bucket(Bucket=self.bucket_name)
-                logging.info(f"StorX vault '{self.bucket_name}' already exists.")
-            except ClientError as e:
-                if e.response['Error']['Code'] == '404':
-                    logging.info(f"Vault '{self.bucket_name}' not found. Creating it...")
-                    self.s3_client.create_bucket(Bucket=self.bucket_name)
-                    logging.info(f"Vault '{self.bucket_name}' created successfully.")
-                else:
-                    logging.error(f"Bucket check failed: {e}")
-                    raise
-
+            # Building the client is local and cheap; the bucket probe is a
+            # network round trip, so it is deferred to the first upload via
+            # _ensure_bucket. Until then the agent is provisionally "real"
+            # and downgrades to simulation mode if that first probe fails.
             self.is_real_integration_possible = True
             logging.info("✅ StorXAgent initialized successfully with real credentials.")
 
@@ -55,32 +107,102 @@ class StorXAgent:
             logging.error(f"Initialization failed: {e}")
             logging.warning("Running in simulation mode due to initialization failure.")
 
-    def upload_document(self, file_content_bytes, object_key):
-        if not self.is_real_integration_possible:
+    def _ensure_bucket(self):
+        """
+        Verifies (and creates if missing) the vault on first use. Runs the
+        head_bucket round trip once per agent instead of on every app start;
+        the lock keeps concurrent first uploads from racing the check.
+        """
+        if self._bucket_checked:
+            return True
+        with self._bucket_lock:
+            if self._bucket_checked:
+                return True
+            try:
+                try:
+                    self.s3_client.head_bucket(Bucket=self.bucket_name)
+                    logging.info(f"StorX vault '{self.bucket_name}' already exists.")
+                except ClientError as e:
+                    if e.response['Error']['Code'] == '404':
+                        logging.info(f"Vault '{self.bucket_name}' not found. Creating it...")
+                        self.s3_client.create_bucket(Bucket=self.bucket_name)
+                        logging.info(f"Vault '{self.bucket_name}' created successfully.")
+                    else:
+                        logging.error(f"Bucket check failed: {e}")
+                        raise
+                self._bucket_checked = True
+                return True
+            except Exception as e:
+                logging.error(f"Bucket verification failed: {e}")
+                logging.warning("Downgrading to simulation mode.")
+                self.is_real_integration_possible = False
+                return False
+
+    def upload_document(self, file_content_bytes, object_key=None):
+        if not isinstance(file_content_bytes, bytes):
+            logging.error("file_content_bytes is not bytes. Encoding as UTF-8.")
+            file_content_bytes = str(file_content_bytes).encode('utf-8')
+
+        # Content-addressed storage: with no explicit key, the key is the
+        # SHA-256 of the content, so identical documents (rerun submissions,
+        # retried uploads) land on the same object and can be deduplicated.
+        content_addressed = object_key is None
+        if content_addressed:
+            object_key = f"sha256/{hashlib.sha256(file_content_bytes).hexdigest()}"
+
+        if not self.is_real_integration_possible or not self._ensure_bucket():
             logging.info("SIMULATION MODE: Skipping real upload.")
             return {"success": True, "url": f"https://simulated.storx.link/{self.bucket_name}/{object_key}"}
 
         try:
-            if not isinstance(file_content_bytes, bytes):
-                logging.error("file_content_bytes is not bytes. Encoding as UTF-8.")
-                file_content_bytes = str(file_content_bytes).encode('utf-8')
-
-            # Wrap the bytes in a BytesIO stream
-            file_stream = io.BytesIO(file_content_bytes)
-
-            # --- DEBUG PRINTS ---
-            print(f"--- DEBUG STORX UPLOAD ---")
-            print(f"  Uploading object_key: {object_key}")
-            print(f"  File size: {len(file_content_bytes)} bytes")
-            print(f"--- END DEBUG ---")
-
-            # More robust alternative to put_object: upload_fileobj
-            self.s3_client.upload_fileobj(
-                Fileobj=file_stream,
-                Bucket=self.bucket_name,
-                Key=object_key,
-                ExtraArgs={'ContentType': 'text/plain'}
-            )
+            if content_addressed:
+                # A hit on the content hash means the exact bytes are already
+                # stored; a cheap HEAD then replaces the whole PUT.
+                try:
+                    self.s3_client.head_object(Bucket=self.bucket_name, Key=object_key)
+                    logging.info(f"Duplicate content, skipping upload: {object_key}")
+                    return {"success": True, "url": f"{self.endpoint_url}/{self.bucket_name}/{object_key}"}
+                except ClientError as e:
+                    if e.response['Error']['Code'] not in ('404', 'NoSuchKey'):
+                        raise
+
+            if STORX_DEBUG:
+                print(f"--- DEBUG STORX UPLOAD ---")
+                print(f"  Uploading object_key: {object_key}")
+                print(f"  File size: {len(file_content_bytes)} bytes")
+                print(f"--- END DEBUG ---")
+
+            # Shrink the wire payload before deciding the upload path: the
+            # loan documents are text and compress several-fold, which cuts
+            # both transfer time and stored bytes.
+            body, content_encoding = _maybe_compress(file_content_bytes)
+
+            if len(body) < self._transfer_config.multipart_threshold:
+                # Small object: pass the bytes straight to put_object, which
+                # hands the buffer to urllib3 without the BytesIO wrapper or
+                # s3transfer's chunked-read machinery.
+                put_kwargs = {
+                    'Bucket': self.bucket_name,
+                    'Key': object_key,
+                    'Body': body,
+                    'ContentType': 'text/plain'
+                }
+                if content_encoding:
+                    put_kwargs['ContentEncoding'] = content_encoding
+                self.s3_client.put_object(**put_kwargs)
+            else:
+                # Large object: wrap in a stream so upload_fileobj can split
+                # it into concurrent multipart uploads.
+                extra_args = {'ContentType': 'text/plain'}
+                if content_encoding:
+                    extra_args['ContentEncoding'] = content_encoding
+                self.s3_client.upload_fileobj(
+                    Fileobj=io.BytesIO(body),
+                    Bucket=self.bucket_name,
+                    Key=object_key,
+                    ExtraArgs=extra_args,
+                    Config=self._transfer_config
+                )
 
             logging.info(f"✅ File uploaded successfully: {object_key}")
             object_url = f"{self.endpoint_url}/{self.bucket_name}/{object_key}"
@@ -97,3 +219,97 @@ class StorXAgent:
             full_error = f"Unexpected error: {e}"
             logging.error(full_error)
             return {"success": False, "error": full_error}
+
+    async def upload_document_async(self, file_content_bytes, object_key=None):
+        """
+        Async variant of upload_document for event-loop callers.
+
+        boto3 is blocking, so the upload runs on a worker thread via
+        asyncio.to_thread; the event loop stays free for other agents'
+        coroutines while the bytes are on the wire. (aioboto3 would give a
+        natively async client, but it is not part of this project's
+        dependency set, and the thread handoff gives the same concurrency
+        for these document-sized uploads.)
+        """
+        return await asyncio.to_thread(self.upload_document, file_content_bytes, object_key)
+
+    def presign_upload(self, object_key, expires=3600):
+        """
+        Returns a presigned PUT URL so the caller can upload bytes directly
+        to StorX (e.g. from a browser or microservice), without relaying the
+        document body through this Python process.
+
+        Args:
+            object_key (str): Destination key in the vault.
+            expires (int): URL validity in seconds.
+
+        Returns:
+            dict: {'success': bool, 'url': str} or {'success': False, 'error': str}.
+        """
+        if not self.is_real_integration_possible:
+            logging.info("SIMULATION MODE: Returning simulated presigned PUT URL.")
+            return {"success": True, "url": f"https://simulated.storx.link/{self.bucket_name}/{object_key}?presigned=put"}
+
+        try:
+            url = self.s3_client.generate_presigned_url(
+                'put_object',
+                Params={'Bucket': self.bucket_name, 'Key': object_key, 'ContentType': 'text/plain'},
+                ExpiresIn=expires
+            )
+            return {"success": True, "url": url}
+        except Exception as e:
+            full_error = f"Presigning PUT URL failed: {e}"
+            logging.error(full_error)
+            return {"success": False, "error": full_error}
+
+    def presign_download(self, object_key, expires=3600):
+        """
+        Returns a presigned GET URL for direct download of a stored document
+        (e.g. the metadata objects referenced by RWATokenizerAgent).
+
+        Args:
+            object_key (str): Key of the stored object.
+            expires (int): URL validity in seconds.
+
+        Returns:
+            dict: {'success': bool, 'url': str} or {'success': False, 'error': str}.
+        """
+        if not self.is_real_integration_possible:
+            logging.info("SIMULATION MODE: Returning simulated presigned GET URL.")
+            return {"success": True, "url": f"https://simulated.storx.link/{self.bucket_name}/{object_key}?presigned=get"}
+
+        try:
+            url = self.s3_client.generate_presigned_url(
+                'get_object',
+                Params={'Bucket': self.bucket_name, 'Key': object_key},
+                ExpiresIn=expires
+            )
+            return {"success": True, "url": url}
+        except Exception as e:
+            full_error = f"Presigning GET URL failed: {e}"
+            logging.error(full_error)
+            return {"success": False, "error": full_error}
+
+    def upload_documents(self, items, max_workers=32):
+        """
+        Uploads many documents concurrently over a thread pool.
+
+        S3-compatible storage scales near-linearly with client concurrency,
+        so fanning N uploads out over threads collapses N sequential round
+        trips into roughly one. The boto3 client is thread-safe and its
+        connection pool is sized to match in __init__.
+
+        Args:
+            items: Iterable of (object_key, file_content_bytes) pairs.
+            max_workers (int): Maximum concurrent uploads.
+
+        Returns:
+            list of dict: upload_document results, in input order.
+        """
+        items = list(items)
+        if not items:
+            return []
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as pool:
+            return list(pool.map(
+                lambda item: self.upload_document(item[1], item[0]), items
+            ))
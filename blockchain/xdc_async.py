@@ -0,0 +1,180 @@
+# blockchain/xdc_async.py
+#
+# Async transaction submission for the XDC network.
+#
+# The sync path in xdc_interact.py blocks the caller on every RPC round trip
+# and waits for each receipt before the next transaction can go out. This
+# module batches N transfers into a single latency window: the nonce is
+# fetched once (pending view), incremented locally per transaction, and the
+# signed transactions are dispatched concurrently with asyncio.gather.
+import asyncio
+import logging
+from decimal import Decimal
+
+from web3 import AsyncWeb3
+
+from blockchain.xdc_interact import MIN_GAS_PRICE_GWEI, SIMPLE_TRANSFER_GAS, _get_signer
+
+# Same lazy-logging idiom as xdc_interact: %-style arguments so disabled
+# levels never format their messages.
+logger = logging.getLogger(__name__)
+
+
+def get_async_web3(rpc_url):
+    """Builds an AsyncWeb3 instance over the async HTTP provider."""
+    return AsyncWeb3(AsyncWeb3.AsyncHTTPProvider(rpc_url))
+
+
+async def connect_to_xdc_testnet_async(rpc_url):
+    """
+    Async counterpart of connect_to_xdc_testnet: builds an AsyncWeb3 over
+    the async HTTP provider and verifies connectivity without blocking the
+    caller's event loop. Returns None if the endpoint is unreachable.
+    """
+    try:
+        w3 = get_async_web3(rpc_url)
+        if await w3.is_connected():
+            chain_id = await w3.eth.chain_id
+            w3._cached_chain_id = chain_id
+            logger.info("✅ Connected to XDC Apothem Testnet (async): %s", rpc_url)
+            logger.info("🔗 Chain ID: %s (expected: 51 for Apothem)", chain_id)
+            if chain_id != 51:
+                logger.warning("⚠️ WARNING: Unexpected Chain ID! Ensure you're on the correct network.")
+            return w3
+        logger.error("❌ Connection failed. AsyncWeb3 instance is not connected.")
+        return None
+    except Exception as e:
+        logger.error("❌ Error connecting to XDC network: %s", e)
+        return None
+
+
+async def send_xdc_transaction_async(w3, private_key_str, from_address, to_address, amount_xdc):
+    """
+    Async single-transfer send: preflight RPCs overlap via asyncio.gather
+    and the receipt wait yields the event loop instead of blocking a
+    thread, so a Streamlit/asyncio caller stays responsive for the whole
+    block-confirmation window.
+
+    Returns the transaction hash (hex) on confirmation, None otherwise.
+    """
+    try:
+        from_addr = AsyncWeb3.to_checksum_address(from_address)
+        to_addr = AsyncWeb3.to_checksum_address(to_address)
+
+        nonce, network_gas_price, chain_id, balance_wei = await asyncio.gather(
+            w3.eth.get_transaction_count(from_addr, 'pending'),
+            w3.eth.gas_price,
+            w3.eth.chain_id,
+            w3.eth.get_balance(from_addr),
+        )
+
+        gas_price = max(network_gas_price, w3.to_wei(MIN_GAS_PRICE_GWEI, 'gwei'))
+        gas_limit = SIMPLE_TRANSFER_GAS
+        amount_wei = w3.to_wei(Decimal(str(amount_xdc)), 'ether')
+
+        if balance_wei < amount_wei + gas_limit * gas_price:
+            logger.error("❌ Insufficient funds for %s tXDC + gas. Transaction aborted.", amount_xdc)
+            return None
+
+        tx = {
+            'nonce': nonce,
+            'to': to_addr,
+            'value': amount_wei,
+            'gas': gas_limit,
+            'gasPrice': gas_price,
+            'chainId': chain_id,
+        }
+        signed = _get_signer(private_key_str).sign_transaction(tx)
+        tx_hash = await w3.eth.send_raw_transaction(signed.raw_transaction)
+        logger.info("✅ Transaction sent! Hash: %s", tx_hash.hex())
+
+        logger.info("⏳ Waiting for transaction receipt...")
+        receipt = await w3.eth.wait_for_transaction_receipt(tx_hash, timeout=60)
+        if receipt.status == 1:
+            logger.info("🎉 Transaction Confirmed in Block %s", receipt.blockNumber)
+            return tx_hash.hex()
+        logger.error("❌ Transaction Failed. Receipt: %s", receipt)
+        return None
+    except Exception as e:
+        logger.error("❌ Error sending transaction: %s", e)
+        return None
+
+
+def send_xdc_transaction_via_async(rpc_url, private_key_str, from_address, to_address, amount_xdc):
+    """
+    Sync wrapper for callers that are not running an event loop yet:
+    connects over the async provider and drives send_xdc_transaction_async
+    to completion with asyncio.run.
+    """
+    async def _run():
+        w3 = await connect_to_xdc_testnet_async(rpc_url)
+        if w3 is None:
+            return None
+        return await send_xdc_transaction_async(
+            w3, private_key_str, from_address, to_address, amount_xdc)
+
+    return asyncio.run(_run())
+
+
+async def send_many(w3, private_key_str, from_address, transfers):
+    """
+    Signs and dispatches many simple XDC transfers concurrently.
+
+    Fetches nonce (pending), gas price, and chain ID once up front (in
+    parallel), signs each transfer with a locally incremented nonce, and
+    sends all raw transactions with asyncio.gather — so N transfers cost
+    roughly one network round trip instead of N sequential ones.
+
+    Note: this does NOT wait for receipts; callers that need confirmation
+    should poll wait_for_transaction_receipt on the returned hashes.
+
+    Args:
+        w3: Connected AsyncWeb3 instance.
+        private_key_str (str): Sender's private key.
+        from_address (str): Sender's address.
+        transfers: Iterable of (to_address, amount_xdc) pairs.
+
+    Returns:
+        list of str: Transaction hashes (hex), in input order.
+    """
+    transfers = list(transfers)
+    if not transfers:
+        return []
+
+    from_addr = AsyncWeb3.to_checksum_address(from_address)
+
+    # One concurrent preflight instead of three serial round trips.
+    nonce, network_gas_price, chain_id = await asyncio.gather(
+        w3.eth.get_transaction_count(from_addr, 'pending'),
+        w3.eth.gas_price,
+        w3.eth.chain_id,
+    )
+
+    # Same minimum-gas-price guard as ai_agent_optimize_gas_price: XDC
+    # testnet nodes often report a price below what they will accept.
+    min_gas_price_wei = w3.to_wei(MIN_GAS_PRICE_GWEI, 'gwei')
+    gas_price = max(network_gas_price, min_gas_price_wei)
+
+    # Derive the signing key once for the whole batch; sign_transaction on
+    # the cached LocalAccount skips the per-call key derivation.
+    signer = _get_signer(private_key_str)
+    signed = []
+    for i, (to_address, amount_xdc) in enumerate(transfers):
+        tx = {
+            'nonce': nonce + i,
+            'to': AsyncWeb3.to_checksum_address(to_address),
+            'value': w3.to_wei(Decimal(str(amount_xdc)), 'ether'),
+            'gas': SIMPLE_TRANSFER_GAS,
+            'gasPrice': gas_price,
+            'chainId': chain_id,
+        }
+        signed.append(signer.sign_transaction(tx))
+
+    logger.info("📤 Dispatching %s transaction(s) concurrently from %s...", len(signed), from_addr)
+    tx_hashes = await asyncio.gather(
+        *[w3.eth.send_raw_transaction(s.raw_transaction) for s in signed]
+    )
+    hashes_hex = [h.hex() for h in tx_hashes]
+    for h in hashes_hex:
+        logger.info("✅ Transaction sent! Hash: %s", h)
+    return hashes_hex
@@ -1,5 +1,6 @@
 import boto3
-import io
+from botocore.config import Config
+import os
 
 ACCESS_KEY = "jvjnzf5qv4tobzhcrahbfgxqd4ta" # YOUR ACTUAL KEY
 SECRET_KEY = "jyp3kil5y5wtsw7n4vve2emipi3gttvir3dc4klelh4kmickjadlc" # YOUR ACTUAL SECRET
@@ -8,24 +9,43 @@ VAULT_NAME = "xdcprojectarea" # YOUR ACTUAL VAULT NAME
 OBJECT_KEY = "test_upload_fileobj.txt" # Changed object key for distinction
 FILE_CONTENT = b"Hello StorX, testing upload_fileobj."
 
-def upload_to_storx():
-    s3_client = boto3.client(
-        's3',
-        endpoint_url=ENDPOINT_URL,
-        aws_access_key_id=ACCESS_KEY,
-        aws_secret_access_key=SECRET_KEY,
-        verify=False
+# Verified TLS lets urllib3 resume the TLS session across requests instead
+# of a full handshake each time (verify=False also spammed
+# InsecureRequestWarning per call). Point STORX_CA_BUNDLE at a PEM file if
+# the gateway cert doesn't validate against the system store.
+VERIFY = os.getenv("STORX_CA_BUNDLE") or True
+
+# Build the client once at module scope: boto3.client() re-parses the
+# service model JSON every call, so hoisting it means repeated uploads
+# (or importing this module from a loop/test harness) pay that cost once
+# and reuse the same keep-alive connection pool.
+_S3_CLIENT = boto3.client(
+    's3',
+    endpoint_url=ENDPOINT_URL,
+    aws_access_key_id=ACCESS_KEY,
+    aws_secret_access_key=SECRET_KEY,
+    verify=VERIFY,
+    config=Config(
+        max_pool_connections=32,
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=30,
+        retries={'mode': 'standard', 'max_attempts': 3}
     )
+)
 
-    file_stream = io.BytesIO(FILE_CONTENT)
+def upload_to_storx():
+    s3_client = _S3_CLIENT
 
     try:
-        # We're now using upload_fileobj
-        s3_client.upload_fileobj(
-            Fileobj=file_stream,
+        # put_object hands the bytes straight to the wire; upload_fileobj
+        # spins up s3transfer's multipart machinery (thread pool, chunked
+        # reads), which is pure overhead for a payload this small.
+        s3_client.put_object(
             Bucket=VAULT_NAME,
             Key=OBJECT_KEY,
-            ExtraArgs={'ContentType': 'text/plain'} # ContentType goes in ExtraArgs for upload_fileobj
+            Body=FILE_CONTENT,
+            ContentType='text/plain'
         )
         print("✅ Upload succeeded!")
         print(f"File URL: {ENDPOINT_URL}/{VAULT_NAME}/{OBJECT_KEY}")